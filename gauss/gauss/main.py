@@ -273,7 +273,7 @@ def nonlinear_solve():
                 max_iterations=maxIterations,
                 significant_figures=precision
             )
-            result = fp.solve(show_steps=False)
+            result = fp.solve(show_steps=False, record_steps=step_by_step)
 
             solution = result['root']
             steps = result['step_strings']
@@ -324,7 +324,8 @@ def nonlinear_solve():
                 x1=x1,
                 tol=epsilon,
                 maxiter=maxIterations,
-                precision=precision
+                precision=precision,
+                verbose=step_by_step
             )
             solution = sec.solve()
             steps = sec.step_strings
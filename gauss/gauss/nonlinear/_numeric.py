@@ -0,0 +1,150 @@
+import math
+import numpy as np
+import sympy as sp
+
+
+def _sympy_evaluator(x, expr):
+    """Evaluate expr (or a tuple of expressions) at a float through sympy.
+
+    Non-real results raise ValueError, as the math module does for domain
+    errors.
+    """
+    if isinstance(expr, tuple):
+        parts = [_sympy_evaluator(x, e) for e in expr]
+        return lambda x_val: tuple(part(x_val) for part in parts)
+
+    def evaluate(x_val):
+        try:
+            value = expr.xreplace({x: sp.Float(x_val)}).evalf()
+        except Exception as e:
+            raise ValueError(f"cannot evaluate {expr} at x = {x_val}: {str(e).strip()}")
+        if not value.is_real:
+            raise ValueError(f"math domain error: {expr} at x = {x_val} is {value}")
+        return float(value)
+    return evaluate
+
+
+# Functions whose math-module versions take any float; expressions built
+# only from these don't need the sympy fallback on every call
+_FLOAT_SAFE = (sp.exp, sp.log, sp.sin, sp.cos, sp.tan, sp.asin, sp.acos, sp.atan,
+               sp.sinh, sp.cosh, sp.tanh, sp.asinh, sp.acosh, sp.atanh,
+               sp.Abs, sp.floor, sp.ceiling)
+
+
+def _float_safe(expr):
+    """True if every function in expr (or a tuple of expressions) is in _FLOAT_SAFE."""
+    exprs = expr if isinstance(expr, tuple) else (expr,)
+    return all(isinstance(fn, _FLOAT_SAFE) for e in exprs for fn in e.atoms(sp.Function))
+
+
+def lambdify_scalar(x, expr, cse=False):
+    """Compile expr (or a tuple of expressions) of x into a function of a float.
+
+    The math module is used where it can print and evaluate the expression.
+    Otherwise evaluation falls back to sympy: for functions math has no
+    printer for (sign(x), the derivative of floor(x)) and for calls math
+    rejects at run time (math.factorial of a float, polygamma).
+    """
+    slow = _sympy_evaluator(x, expr)
+    try:
+        fast = sp.lambdify(x, expr, modules=['math'], cse=cse)
+    except Exception:
+        return slow
+    if _float_safe(expr):
+        return fast
+
+    def evaluate(x_val):
+        try:
+            return fast(x_val)
+        except (TypeError, NameError):
+            return slow(x_val)
+    return evaluate
+
+
+def lambdify_array(x, expr, cse=False):
+    """Compile expr (or a tuple of expressions) of x for numpy arrays.
+
+    Expressions numpy can't print or evaluate are mapped element by element
+    through lambdify_scalar, with NaN where a value is undefined.
+    """
+    scalar = lambdify_scalar(x, expr, cse=cse)
+    n_out = len(expr) if isinstance(expr, tuple) else 1
+
+    def evaluate_or_nan(x_val):
+        try:
+            return scalar(x_val)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return (math.nan,) * n_out if n_out > 1 else math.nan
+
+    slow = np.vectorize(evaluate_or_nan, otypes=[float] * n_out)
+    try:
+        fast = sp.lambdify(x, expr, modules=['numpy'], cse=cse)
+    except Exception:
+        return slow
+
+    def evaluate(xs):
+        try:
+            return fast(xs)
+        except (TypeError, NameError):
+            return slow(xs)
+    return evaluate
+
+
+def sweep(step, starts, max_iterations, epsilon):
+    """Iterate from many starting points at once, one vectorized step per iteration.
+
+    step(idx, x) advances the active points, where idx are their positions in
+    starts and x their current iterates, and returns
+    (x_new, valid, exact, settled):
+    - valid is False where the step failed: a zero denominator, a non-finite
+      x_new, or an x_new outside the domain of the function. Those points
+      stop at their last valid iterate.
+    - exact is True where x is already a root; those points stop there with
+      a zero error.
+    - settled is True where x_new is accepted whatever its relative error,
+      e.g. on a residual test.
+    None for exact or settled means no such point. Otherwise a point
+    converges once its relative error (%) is within epsilon.
+
+    Returns a dict of arrays: roots, iterations, relative_errors, converged.
+    """
+    roots = np.array(starts, dtype=float).ravel()
+    iterations = np.zeros(roots.shape, dtype=int)
+    relative_errors = np.full(roots.shape, np.inf)
+    converged = np.zeros(roots.shape, dtype=bool)
+    active = np.ones(roots.shape, dtype=bool)
+
+    with np.errstate(all='ignore'):
+        for i in range(max_iterations):
+            idx = np.flatnonzero(active)
+            if idx.size == 0:
+                break
+            x_old = roots[idx]
+            x_new, valid, exact, settled = step(idx, x_old)
+            # The clamp keeps a zero x_new from dividing by zero: the error
+            # is huge when x_old isn't zero too, and 0 when both are
+            rel_error = np.abs(x_new - x_old) / np.maximum(np.abs(x_new), 1e-300) * 100
+
+            if exact is not None:
+                valid = valid & ~exact
+                relative_errors[idx[exact]] = 0.0
+                converged[idx[exact]] = True
+            else:
+                exact = np.zeros(idx.shape, dtype=bool)
+            done = rel_error <= epsilon
+            if settled is not None:
+                done |= settled
+            done &= valid
+
+            roots[idx[valid]] = x_new[valid]
+            relative_errors[idx[valid]] = rel_error[valid]
+            iterations[idx[valid]] = i + 1
+            converged[idx[done]] = True
+            active[idx[done | exact | ~valid]] = False
+
+    return {
+        'roots': roots,
+        'iterations': iterations,
+        'relative_errors': relative_errors,
+        'converged': converged
+    }
@@ -1,10 +1,12 @@
 """
 Examples using Fixed Point and Newton-Raphson methods
 with exponential and trigonometric functions
+
+Run from the directory containing main.py: python -m nonlinear.examples
 """
 
-from fixedpoint import FixedPointMethod
-from original_newton_raph import NewtonRaphsonMethod
+from nonlinear.fixedpoint import FixedPointMethod
+from nonlinear.original_newton_raph import NewtonRaphsonMethod
 
 
 def exponential_and_trig_examples():
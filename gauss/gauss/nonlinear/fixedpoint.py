@@ -1,45 +1,156 @@
+import functools
 import math
 import time
+import numpy as np
 import sympy as sp
-from decimal import Decimal, Context
+from ._numeric import lambdify_array, lambdify_scalar, sweep
+
+_SEP = "=" * 70
+_LOG10_2 = math.log10(2)
+_DIVERGENCE_LIMIT = 1e12  # |x| beyond this is treated as divergence
+
+# One row per iteration; preallocated in solve() and truncated afterwards
+_HISTORY_DTYPE = np.dtype([
+    ('iteration', 'i4'),
+    ('x_old', 'f8'),
+    ('x_new', 'f8'),
+    ('g(x_old)', 'f8'),
+    ('relative_error', 'f8'),
+    ('accelerated', '?'),
+])
+
+_ACCEL_MODES = ('none', 'steffensen', 'auto')
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_g(g_equation_str):
+    """Parse and compile g(x) once per distinct equation string."""
+    x = sp.Symbol('x')
+    g = sp.sympify(g_equation_str)
+    return g, lambdify_scalar(x, g)
+
+
+@functools.lru_cache(maxsize=256)
+def _differentiate_g(g_equation_str):
+    """Differentiate and compile g'(x) once per distinct equation string."""
+    x = sp.Symbol('x')
+    g, _ = _parse_g(g_equation_str)
+    g_prime = sp.diff(g, x)
+    return g_prime, lambdify_scalar(x, g_prime)
+
+
+@functools.lru_cache(maxsize=256)
+def _vectorize_g(g_equation_str):
+    """Compile g(x) for numpy arrays once per distinct equation string."""
+    g, _ = _parse_g(g_equation_str)
+    return lambdify_array(sp.Symbol('x'), g)
 
 
 class FixedPointMethod:
 
     def __init__(self, g_equation_str, initial_guess,
-                 epsilon=0.00001, max_iterations=50, significant_figures=5):
+                 epsilon=0.00001, max_iterations=50, significant_figures=5,
+                 enable_validation=True, accel='none'):
 
-        self.g_equation_str = g_equation_str
-        self.x0 = initial_guess
-        self.epsilon = epsilon * 100  # Convert decimal to percentage (0.00001 -> 0.001%)
-        self.max_iterations = max_iterations
-        self.significant_figures = significant_figures
+        self._init_state(g_equation_str, initial_guess, epsilon, max_iterations,
+                         significant_figures, enable_validation, accel)
 
         # Parse g equation
         self.x = sp.Symbol('x')
         try:
-            self.g = sp.sympify(g_equation_str)
-            self.g_prime = sp.diff(self.g, self.x)
+            self.g, self._g_num = _parse_g(g_equation_str)
         except Exception as e:
             raise ValueError(f"Error parsing g equation: {e}")
 
+    @classmethod
+    def from_callable(cls, g, initial_guess, g_prime=None, **kwargs):
+        """Build a solver around a plain float function g(x), skipping sympy.
+
+        g_prime defaults to a central finite difference of g. Remaining keyword
+        arguments are the same as for __init__.
+        """
+        obj = cls.__new__(cls)
+        obj._init_state(getattr(g, '__name__', 'g'), initial_guess, **kwargs)
+        obj.x = None
+        obj.g = None
+        obj.g_prime = None
+        obj._g_num = g
+        if obj.enable_validation:
+            obj._g_prime_num = g_prime or (lambda v: (g(v + 1e-6) - g(v - 1e-6)) / 2e-6)
+        return obj
+
+    def _init_state(self, g_equation_str, initial_guess, epsilon=0.00001, max_iterations=50,
+                    significant_figures=5, enable_validation=True, accel='none'):
+        """Store the settings, build the header and reset the results."""
+        self.g_equation_str = g_equation_str
+        self.x0 = initial_guess
+        self.epsilon = epsilon * 100  # Convert decimal to percentage (0.00001 -> 0.001%)
+        self.max_iterations = max_iterations
+        self.significant_figures = significant_figures
+        self.enable_validation = enable_validation  # False skips g'(x) and the |g'(x0)| < 1 check
+        # 'steffensen' applies Aitken Δ² every step, 'auto' only when |g'(x0)| >= 0.5
+        if accel not in _ACCEL_MODES:
+            raise ValueError(f"accel must be one of {_ACCEL_MODES}, got {accel!r}")
+        self.accel = accel
+
+        # Header is fixed for the instance, so build it once
+        self._header = (
+            f"{_SEP}\n"
+            "Fixed Point Iteration Method\n"
+            f"{_SEP}\n"
+            f"Iteration form: x = g(x) = {self.g_equation_str}\n"
+            f"Initial guess: x₀ = {self.x0}\n"
+            f"Tolerance (ε): {self.epsilon/100} ({self.epsilon}%)\n"
+            f"Max iterations: {self.max_iterations}\n"
+            + (f"Acceleration: {self.accel} (Steffensen / Aitken Δ²)\n" if self.accel != 'none' else "")
+            + f"{_SEP}"
+        )
+
         # Results storage
         self.root = None
         self.iterations = 0
         self.relative_error = None
         self.execution_time = 0
-        self.iteration_history = []
+        self.iteration_history = np.empty(0, dtype=_HISTORY_DTYPE)
         self.converged = False
         self.error_message = None
         self.step_strings = []
         self.last_significant_figures = 0
-
-
+        self.accelerated_steps = 0
+
+    @functools.cached_property
+    def g_prime(self):
+        """Symbolic g'(x), differentiated on first use (None without validation)."""
+        if not self.enable_validation:
+            return None
+        return _differentiate_g(self.g_equation_str)[0]
+
+    @functools.cached_property
+    def _g_prime_num(self):
+        """Compiled g'(x), built on first use (None without validation)."""
+        if not self.enable_validation:
+            return None
+        return _differentiate_g(self.g_equation_str)[1]
+
+    @functools.cached_property
+    def _g_vec(self):
+        """g(x) evaluated elementwise over a numpy array, used by solve_many()."""
+        if self.g is None:  # built with from_callable
+            g = self._g_num
+
+            def g_or_nan(x_val):
+                # An undefined g(x) stops that guess, as lambdify_array does
+                try:
+                    return g(x_val)
+                except (ValueError, ZeroDivisionError, OverflowError):
+                    return math.nan
+            return np.vectorize(g_or_nan, otypes=[float])
+        return _vectorize_g(self.g_equation_str)
 
     def evaluate_function(self, func, x_val):
-        """Safely evaluate a symbolic function at x_val."""
+        """Safely evaluate a compiled function (e.g. self._g_num) at x_val."""
         try:
-            return float(func.subs(self.x, x_val))
+            return float(func(x_val))
         except Exception as e:
             raise ValueError(f"Error evaluating function at x={x_val}: {e}")
 
@@ -47,12 +158,10 @@ class FixedPointMethod:
         """Round number to specified significant figures."""
         if x == 0:
             return 0.0
-        try:
-            x_str = str(x)
-            ctx = Context(prec=self.significant_figures)
-            return float(ctx.create_decimal(x_str).normalize())
-        except:
+        if not math.isfinite(x):
             return float(x)
+        digits = self.significant_figures - 1 - math.floor(math.log10(abs(x)))
+        return float(round(x, digits))
 
     def calculate_relative_error(self, x_new, x_old):
         """Calculate approximate relative error."""
@@ -72,34 +181,41 @@ class FixedPointMethod:
             return 10
         # Use percentage value in the formula: rel_error_percentage = rel_error_decimal * 100
         rel_error_percentage = rel_error_decimal * 100
-        n = 2 - math.log10(2 * rel_error_percentage)
+        # 2·pct = m·2^e with m in [0.5, 1), so log10(2·pct) = e·log10(2) + log10(m)
+        m, e = math.frexp(2 * rel_error_percentage)
+        n = 2 - (e * _LOG10_2 + math.log10(m))
         return max(0, int(n))
 
     def check_convergence_condition(self):
         """Check if |g'(x)| < 1 at initial guess."""
+        if not self.enable_validation:
+            return True, None
         try:
-            g_prime_val = self.evaluate_function(self.g_prime, self.x0)
+            # g'(x) is differentiated and compiled here, on first use
+            g_prime_val = self.evaluate_function(self._g_prime_num, self.x0)
             return abs(g_prime_val) < 1, g_prime_val
-        except:
+        except ValueError:
             return False, None
 
-    def solve(self, show_steps=False):
-        """Solve using Fixed Point Iteration."""
+    def _format_iteration(self, row):
+        """Format one iteration_history row as a step string."""
+        iteration, x_old, x_new, g_val, rel_error, accelerated = row.item()
+        return "\n".join([
+            f"Iteration {iteration}:",
+            f"  x_old = {x_old}",
+            f"  x_new = {'Steffensen step' if accelerated else 'g(x_old)'} = {x_new}",
+            f"  g(x_old) = {g_val}" if math.isfinite(g_val) else "  g(x_old) = undefined",
+            f"  |εₐ| = {rel_error:.6f}%" if math.isfinite(rel_error) else "  |εₐ| = N/A"
+        ])
+
+    def solve(self, show_steps=False, record_steps=True):
+        """Solve using Fixed Point Iteration.
+
+        With record_steps=False (and show_steps=False) the per-iteration step
+        strings are not formatted; the numbers remain in iteration_history.
+        """
         start_time = time.time()
-        self.step_strings = []
-
-        # Header
-        header = [
-            "=" * 70,
-            "Fixed Point Iteration Method",
-            "=" * 70,
-            f"Iteration form: x = g(x) = {self.g_equation_str}",
-            f"Initial guess: x₀ = {self.x0}",
-            f"Tolerance (ε): {self.epsilon/100} ({self.epsilon}%)",
-            f"Max iterations: {self.max_iterations}",
-            "=" * 70
-        ]
-        self.step_strings.append("\n".join(header))
+        self.step_strings = [self._header]
 
         # Convergence check
         converges, g_prime_val = self.check_convergence_condition()
@@ -110,69 +226,100 @@ class FixedPointMethod:
             )
             self.step_strings.append(warning)
 
+        # Slowly contracting (or diverging) iterations are where Δ² pays off
+        use_acceleration = (self.accel == 'steffensen' or
+                            (self.accel == 'auto' and (g_prime_val is None or abs(g_prime_val) >= 0.5)))
+
         x_old = self.x0
         x_new = self.x0
-        self.iteration_history = []
+        history = np.empty(self.max_iterations, dtype=_HISTORY_DTYPE)
+        recorded = 0
         last_valid_x = self.x0
+        prev_growth = 1.0
+
+        # Loop invariants bound to locals
+        g_call = self._g_num
+        round_sig = self.round_sig
+        relative_error = self.calculate_relative_error
+        isfinite = math.isfinite
+        eps = self.epsilon
+        steps_append = self.step_strings.append
+        format_iteration = self._format_iteration
+        format_steps = show_steps or record_steps
+        accelerated_steps = 0
+        x_old_rounded = round_sig(x_old)
+
+        def last_recorded_error():
+            """Relative error of the last recorded iteration, if finite."""
+            if recorded:
+                rel_error = float(history['relative_error'][recorded - 1])
+                if isfinite(rel_error):
+                    return rel_error
+            return None
 
         for i in range(self.max_iterations):
             try:
-                x_new_raw = self.evaluate_function(self.g, x_old)
-
-                if not math.isfinite(x_new_raw):
-                    self.error_message = f"Iteration {i + 1}: Non-finite value (NaN/Inf)"
-                    self.step_strings.append(self.error_message)
+                g1 = float(g_call(x_old))
+                x_new_raw = g1
+                accelerated = False
+
+                # Steffensen: x_new = x_old - (g1 - x_old)^2 / (g(g1) - 2 g1 + x_old),
+                # falling back to the plain step when the denominator is (near) zero
+                if use_acceleration and isfinite(g1):
+                    g2 = float(g_call(g1))
+                    denom = g2 - 2 * g1 + x_old
+                    if isfinite(denom) and abs(denom) > 1e-14 * (1 + abs(x_old)):
+                        x_new_raw = x_old - (g1 - x_old) ** 2 / denom
+                        accelerated = True
+                        accelerated_steps += 1
+
+                # One guard for NaN/Inf and runaway magnitude (NaN fails the comparison)
+                if not -_DIVERGENCE_LIMIT <= x_new_raw <= _DIVERGENCE_LIMIT:
+                    if isfinite(x_new_raw):
+                        self.error_message = "Method diverging (values too large)"
+                        self.iterations = i + 1
+                    else:
+                        self.error_message = f"Iteration {i + 1}: Non-finite value (NaN/Inf)"
+                    steps_append(self.error_message)
                     x_new = last_valid_x
+                    self.relative_error = last_recorded_error()
                     break
 
-                x_new = self.round_sig(x_new_raw)
+                x_new = round_sig(x_new_raw)
                 last_valid_x = x_new
 
-                rel_error = self.calculate_relative_error(x_new, x_old)
-                rel_error = self.round_sig(rel_error) if math.isfinite(rel_error) else rel_error
-
-                g_val = self.round_sig(x_new_raw) if math.isfinite(x_new_raw) else x_new_raw
+                rel_error = relative_error(x_new, x_old)
+                rel_error = round_sig(rel_error) if isfinite(rel_error) else rel_error
 
-                x_old_rounded = self.round_sig(x_old)
-                x_new_rounded = self.round_sig(x_new)
+                # x_new is already rounded, and equals round(g(x_old)) on a plain step
+                g_val = round_sig(g1) if accelerated else x_new
 
-                iteration_data = {
-                    'iteration': i + 1,
-                    'x_old': x_old_rounded,
-                    'x_new': x_new_rounded,
-                    'g(x_old)': g_val,
-                    'relative_error': rel_error
-                }
-                self.iteration_history.append(iteration_data)
+                history[i] = (i + 1, x_old_rounded, x_new, g_val, rel_error, accelerated)
+                recorded = i + 1
 
-                iteration_step = [
-                    f"Iteration {i + 1}:",
-                    f"  x_old = {x_old_rounded}",
-                    f"  x_new = g(x_old) = {x_new_rounded}",
-                    f"  g(x_old) = {g_val}" if math.isfinite(g_val) else "  g(x_old) = undefined",
-                    f"  |εₐ| = {rel_error:.6f}%" if math.isfinite(rel_error) else "  |εₐ| = N/A"
-                ]
-                self.step_strings.append("\n".join(iteration_step))
-
-                if show_steps:
-                    print("\n".join(iteration_step))
+                if format_steps:
+                    iteration_step = format_iteration(history[i])
+                    if record_steps:
+                        steps_append(iteration_step)
+                    if show_steps:
+                        print(iteration_step)
 
                 # Simple convergence check - stop when error <= epsilon
-                if math.isfinite(rel_error) and rel_error <= self.epsilon:
+                if isfinite(rel_error) and rel_error <= eps:
                     self.converged = True
-                    self.root = x_new_rounded
+                    self.root = x_new
                     self.iterations = i + 1
                     self.relative_error = rel_error
-                    self.step_strings.append(f"✓ Converged! Error {rel_error:.6f}% <= {self.epsilon}%")
+                    steps_append(f"✓ Converged! Error {rel_error:.6f}% <= {eps}%")
                     break
 
                 # Check for oscillation (alternating between two values)
                 if i >= 3:  # Need at least 3 iterations to detect pattern
                     # Check if we're oscillating between two values with same error
-                    if len(self.iteration_history) >= 3:
-                        last_3_errors = [self.iteration_history[-j]['relative_error'] for j in range(1, 4)]
-                        last_3_values = [self.iteration_history[-j]['x_new'] for j in range(1, 4)]
-                        
+                    if recorded >= 3:
+                        last_3_errors = history['relative_error'][i:i - 3:-1]
+                        last_3_values = history['x_new'][i:i - 3:-1]
+
                         # Check if error is constant and values are alternating
                         if (abs(last_3_errors[0] - last_3_errors[1]) < 1e-10 and 
                             abs(last_3_errors[1] - last_3_errors[2]) < 1e-10 and
@@ -180,30 +327,45 @@ class FixedPointMethod:
                             abs(last_3_values[0] - last_3_values[1]) > 1e-10):
                             
                             self.converged = True
-                            self.root = x_new_rounded
+                            self.root = x_new
                             self.iterations = i + 1
                             self.relative_error = rel_error
-                            self.step_strings.append(f"✓ Converged! Oscillation detected - method reached numerical precision limit")
+                            steps_append(f"✓ Converged! Oscillation detected - method reached numerical precision limit")
                             break
 
-                if i > 5 and abs(x_new) > 1e10:
+                # Diverging: |x| grew 100x on two consecutive steps
+                growth = abs(x_new) / abs(x_old) if x_old else float('inf')
+                if i >= 2 and abs(x_new) > 1.0 and growth > 100 and prev_growth > 100:
                     self.error_message = "Method diverging (values too large)"
-                    self.step_strings.append(self.error_message)
-                    self.root = self.round_sig(last_valid_x)
+                    steps_append(self.error_message)
+                    self.root = round_sig(last_valid_x)
                     self.iterations = i + 1
-                    self.relative_error = rel_error if math.isfinite(rel_error) else None
+                    self.relative_error = rel_error if isfinite(rel_error) else None
                     break
 
-                x_old = x_new
+                prev_growth = growth
+                x_old = x_old_rounded = x_new
+
+            except OverflowError:
+                # math-module g overflowed: same outcome as the magnitude guard
+                self.error_message = "Method diverging (values too large)"
+                steps_append(self.error_message)
+                self.root = round_sig(last_valid_x)
+                self.iterations = i + 1
+                self.relative_error = last_recorded_error()
+                break
 
             except Exception as e:
                 self.error_message = f"Error at iteration {i + 1}: {str(e)}"
-                self.step_strings.append(self.error_message)
-                self.root = self.round_sig(last_valid_x)
+                steps_append(self.error_message)
+                self.root = round_sig(last_valid_x)
                 self.iterations = i + 1
                 self.relative_error = None
                 break
 
+        self.iteration_history = history[:recorded]
+        self.accelerated_steps = accelerated_steps
+
         if self.root is None:
             self.root = self.round_sig(last_valid_x)
 
@@ -228,7 +390,7 @@ class FixedPointMethod:
             self.last_significant_figures = self.significant_figures
 
         # Final results
-        results = ["", "=" * 70, "RESULTS", "=" * 70]
+        results = [f"\n{_SEP}\nRESULTS\n{_SEP}"]
 
         if self.converged:
             results.extend([
@@ -236,9 +398,9 @@ class FixedPointMethod:
                 f"Root: {self.round_sig(self.root)}",
             ])
             try:
-                g_at_root = self.evaluate_function(self.g, self.root)
+                g_at_root = self.evaluate_function(self._g_num, self.root)
                 results.append(f"g(root) = {self.round_sig(g_at_root)}")
-            except:
+            except ValueError:
                 results.append("g(root) = Could not evaluate")
         else:
             results.extend([
@@ -252,14 +414,52 @@ class FixedPointMethod:
         if self.relative_error is not None:
             results.append(f"Relative error: {self.round_sig(self.relative_error):.6f}%")
         results.append(f"Time: {self.execution_time:.6f}s")
-        results.append("=" * 70)
+        results.append(_SEP)
 
         self.step_strings.append("\n".join(results))
 
         return self.get_results()
 
-    def get_results(self):
-        """Return results dictionary."""
+    def solve_many(self, initial_guesses):
+        """Run the plain x = g(x) iteration from many initial guesses at once.
+
+        Every active guess is advanced with one vectorized g evaluation per
+        iteration. No rounding, acceleration or step strings are applied.
+        A guess whose iterate runs past the divergence limit, or leaves the
+        domain of g, stops at its last valid iterate. See _numeric.sweep for
+        the returned arrays.
+        """
+        g_vec = self._g_vec
+
+        def evaluate(x):
+            return np.broadcast_to(np.asarray(g_vec(x), dtype=float), x.shape)
+
+        starts = np.array(initial_guesses, dtype=float).ravel()
+        with np.errstate(all='ignore'):
+            g_x = evaluate(starts).copy()  # g at each current iterate
+
+        def step(idx, x):
+            # x_new = g(x) is known; g(x_new) is computed now so that an
+            # x_new outside the domain of g is never reported as a root
+            x_new = g_x[idx]
+            g_new = evaluate(x_new)
+            g_x[idx] = g_new
+            valid = (np.isfinite(x_new) & (np.abs(x_new) <= _DIVERGENCE_LIMIT)
+                     & np.isfinite(g_new))
+            return x_new, valid, None, None
+
+        return sweep(step, starts, self.max_iterations, self.epsilon)
+
+    def history_as_dicts(self):
+        """Return iteration_history as a list of per-iteration dicts."""
+        return [dict(zip(_HISTORY_DTYPE.names, row)) for row in self.iteration_history.tolist()]
+
+    def get_results(self, as_dicts=True):
+        """Return results dictionary.
+
+        iteration_history is converted to a list of dicts unless as_dicts=False,
+        in which case the structured array is returned as-is.
+        """
         return {
             'root': self.round_sig(self.root) if self.root is not None else self.round_sig(self.x0),
             'iterations': self.iterations,
@@ -267,9 +467,10 @@ class FixedPointMethod:
             'execution_time': self.round_sig(self.execution_time),
             'converged': self.converged,
             'error_message': self.error_message,
-            'iteration_history': self.iteration_history,
+            'iteration_history': self.history_as_dicts() if as_dicts else self.iteration_history,
             'step_strings': self.step_strings,
-            'significant_figures': self.last_significant_figures
+            'significant_figures': self.last_significant_figures,
+            'accelerated_steps': self.accelerated_steps
         }
 
     def print_results(self):
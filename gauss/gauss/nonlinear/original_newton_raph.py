@@ -1,7 +1,58 @@
+import functools
 import math
 import time
+import numpy as np
 import sympy as sp
-from decimal import Decimal, Context
+from ._numeric import lambdify_array, lambdify_scalar, sweep
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_equation(equation_str):
+    """Parse and differentiate f once per distinct equation string."""
+    f = sp.sympify(equation_str)
+    return f, sp.diff(f, sp.Symbol('x'))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_equation(equation_str):
+    """Compile f once per distinct equation string.
+
+    Returns (f_num, f_fp_num) where f_fp_num returns (f(x), f'(x)) from a
+    single call, with subexpressions shared between f and f' computed once.
+    """
+    x = sp.Symbol('x')
+    f, f_prime = _parse_equation(equation_str)
+    f_num = lambdify_scalar(x, f)
+    f_fp_num = lambdify_scalar(x, (f, f_prime), cse=True)
+    return f_num, f_fp_num
+
+
+@functools.lru_cache(maxsize=128)
+def _vectorize_equation(equation_str):
+    """Compile (f, f') for numpy arrays once per distinct equation string."""
+    f, f_prime = _parse_equation(equation_str)
+    return lambdify_array(sp.Symbol('x'), (f, f_prime), cse=True)
+
+
+@functools.lru_cache(maxsize=256)
+def _count_sig(x_new, x_old):
+    """Count the number of correct significant figures."""
+    if x_new == 0:
+        return 0
+
+    rel_error_decimal = abs((x_new - x_old) / x_new)
+    if rel_error_decimal == 0:
+        return 15  # Maximum precision for float (was inf)
+
+    # Significant figures based on relative error
+    # |εa| = (0.5 × 10^(2-n)) %
+    if rel_error_decimal < 1e-10:
+        return 10
+
+    # Use percentage value in the formula: rel_error_percentage = rel_error_decimal * 100
+    rel_error_percentage = rel_error_decimal * 100
+    n = 2 - math.log10(2 * rel_error_percentage)
+    return max(0, int(n))
 
 
 class NewtonRaphsonMethod:
@@ -15,30 +66,68 @@ class NewtonRaphsonMethod:
         self.epsilon = epsilon * 100  # Convert decimal to percentage (0.00001 -> 0.001%)
         self.max_iterations = max_iterations
         self.significant_figures = significant_figures
+        # Built once so the iteration loop doesn't re-parse a dynamic spec
+        self._fmt_g = f"{{:.{significant_figures}g}}"
 
         # Parse equation and compute derivative
         self.x = sp.Symbol('x')
         try:
-            self.f = sp.sympify(equation_str)
-            self.f_prime = sp.diff(self.f, self.x)
+            self.f, self.f_prime = _parse_equation(equation_str)
         except Exception as e:
             raise ValueError(f"Error parsing equation: {e}")
+        unknown = self.f.free_symbols - {self.x}
+        if unknown:
+            names = ", ".join(sorted(str(s) for s in unknown))
+            raise ValueError(f"Error parsing equation: f must depend on x only, found {names}")
+        self._f_num, self._f_fp_num = _compile_equation(equation_str)
 
         # Results storage
         self.root = None
         self.iterations = 0
         self.relative_error = None
         self.execution_time = 0
-        self.iteration_history = []
         self.converged = False
         self.error_message = None
         self.step_strings = []  # For frontend display
 
+        # Iteration history, one preallocated array per column; the first
+        # _hist_len entries are filled by solve()
+        self._hist_x_old = np.empty(max_iterations)
+        self._hist_f_old = np.empty(max_iterations)
+        self._hist_fp_old = np.empty(max_iterations)
+        self._hist_x_new = np.empty(max_iterations)
+        self._hist_f_new = np.empty(max_iterations)
+        self._hist_rel_error = np.empty(max_iterations)
+        self._hist_len = 0
+
+    @property
+    def iteration_history(self):
+        """Per-iteration records as a list of dicts, built from the history arrays."""
+        n = self._hist_len
+        columns = zip(self._hist_x_old[:n].tolist(), self._hist_f_old[:n].tolist(),
+                      self._hist_fp_old[:n].tolist(), self._hist_x_new[:n].tolist(),
+                      self._hist_f_new[:n].tolist(), self._hist_rel_error[:n].tolist())
+        return [
+            {
+                'iteration': i + 1,
+                'x_old': x_old,
+                'f(x_old)': f_old,
+                'f_prime(x_old)': fp_old,
+                'x_new': x_new,
+                'f(x_new)': f_new,
+                'relative_error': rel_error
+            }
+            for i, (x_old, f_old, fp_old, x_new, f_new, rel_error) in enumerate(columns)
+        ]
+
     def evaluate_function(self, func, x_val):
         """Safely evaluate a symbolic function at x_val."""
         try:
-            result = float(func.subs(self.x, x_val))
-            return result
+            # xreplace skips the rewriting machinery of subs; plain numbers
+            # don't need it
+            if isinstance(x_val, (int, float)):
+                return float(func.xreplace({self.x: sp.Float(x_val)}))
+            return float(func.subs(self.x, x_val))
         except Exception as e:
             raise ValueError(f"Error evaluating function at x={x_val}: {e}")
 
@@ -46,12 +135,10 @@ class NewtonRaphsonMethod:
         """Round number to specified significant figures."""
         if x == 0:
             return 0.0
-        try:
-            x_str = str(x)
-            ctx = Context(prec=self.significant_figures)
-            return float(ctx.create_decimal(x_str).normalize())
-        except:
+        if not math.isfinite(x):
             return float(x)
+        digits = self.significant_figures - 1 - math.floor(math.log10(abs(x)))
+        return float(round(x, digits))
 
     def calculate_relative_error(self, x_new, x_old):
         """Calculate approximate relative error."""
@@ -68,22 +155,17 @@ class NewtonRaphsonMethod:
 
     def count_significant_figures(self, x_new, x_old):
         """Count the number of correct significant figures."""
-        if x_new == 0:
-            return 0
-
-        rel_error_decimal = abs((x_new - x_old) / x_new)
-        if rel_error_decimal == 0:
-            return 15  # Maximum precision for float (was inf)
+        return _count_sig(x_new, x_old)
 
-        # Significant figures based on relative error
-        # |εa| = (0.5 × 10^(2-n)) %
-        if rel_error_decimal < 1e-10:
-            return 10
-
-        # Use percentage value in the formula: rel_error_percentage = rel_error_decimal * 100
-        rel_error_percentage = rel_error_decimal * 100
-        n = 2 - math.log10(2 * rel_error_percentage)
-        return max(0, int(n))
+    def _final_significant_figures(self):
+        """Significant figures of the final answer, from the last two iterates."""
+        if self.relative_error == 0:
+            return self.significant_figures  # Use precision when exact solution found
+        n = self._hist_len
+        if n >= 2:
+            return _count_sig(float(self._hist_x_new[n - 1]),
+                              float(self._hist_x_new[n - 2]))
+        return self.significant_figures
 
     def solve(self, show_steps=False):
         """
@@ -113,13 +195,15 @@ class NewtonRaphsonMethod:
         self.step_strings.append("\n".join(header))
 
         x_old = self.x0
-        self.iteration_history = []
+        self._hist_len = 0
+        fmt = self._fmt_g.format
 
         for i in range(self.max_iterations):
             try:
-                # Evaluate function and derivative at x_old
-                f_val = self.evaluate_function(self.f, x_old)
-                f_prime_val = self.evaluate_function(self.f_prime, x_old)
+                # f and f' at x_old were evaluated at the end of the previous
+                # iteration; only the first iteration evaluates them here
+                if i == 0:
+                    f_val, f_prime_val = map(float, self._f_fp_num(x_old))
 
 
 
@@ -148,35 +232,33 @@ class NewtonRaphsonMethod:
                 # Newton-Raphson formula: x_new = x_old - f(x_old)/f'(x_old)
                 x_new = x_old - (f_val / f_prime_val)
 
-                # Round x_new to specified precision
-                x_new = self.round_sig(x_new)
-
                 # Calculate errors
                 rel_error = self.calculate_relative_error(x_new, x_old)
-                f_new_val = self.evaluate_function(self.f, x_new)
+                if rel_error <= self.epsilon or i == self.max_iterations - 1:
+                    # Last iteration: f'(x_new) would never be used
+                    f_new_val, f_prime_new_val = float(self._f_num(x_new)), None
+                else:
+                    f_new_val, f_prime_new_val = map(float, self._f_fp_num(x_new))
 
 
 
                 # Store iteration data
-                iteration_data = {
-                    'iteration': i + 1,
-                    'x_old': x_old,
-                    'f(x_old)': f_val,
-                    'f_prime(x_old)': f_prime_val,
-                    'x_new': x_new,
-                    'f(x_new)': f_new_val,
-                    'relative_error': rel_error
-                }
-                self.iteration_history.append(iteration_data)
+                self._hist_x_old[i] = x_old
+                self._hist_f_old[i] = f_val
+                self._hist_fp_old[i] = f_prime_val
+                self._hist_x_new[i] = x_new
+                self._hist_f_new[i] = f_new_val
+                self._hist_rel_error[i] = rel_error
+                self._hist_len = i + 1
 
                 # Add iteration as a single step string
                 iteration_step = [
                     f"Iteration {i + 1}:",
-                    f"  x_{i} = {x_old:.{self.significant_figures}g}",
-                    f"  f(x_{i}) = {f_val:.{self.significant_figures}g}",
-                    f"  f'(x_{i}) = {f_prime_val:.{self.significant_figures}g}",
-                    f"  x_{i + 1} = x_{i} - f(x_{i})/f'(x_{i}) = {x_new:.{self.significant_figures}g}",
-                    f"  f(x_{i + 1}) = {f_new_val:.{self.significant_figures}g}",
+                    f"  x_{i} = {fmt(x_old)}",
+                    f"  f(x_{i}) = {fmt(f_val)}",
+                    f"  f'(x_{i}) = {fmt(f_prime_val)}",
+                    f"  x_{i + 1} = x_{i} - f(x_{i})/f'(x_{i}) = {fmt(x_new)}",
+                    f"  f(x_{i + 1}) = {fmt(f_new_val)}",
                     f"  |εₐ| = {rel_error:.6f}%"
                 ]
                 self.step_strings.append("\n".join(iteration_step))
@@ -189,7 +271,7 @@ class NewtonRaphsonMethod:
                     print(f"  x_{i + 1} = x_{i} - f(x_{i})/f'(x_{i}) = {x_new:.10f}")
                     print(f"  f(x_{i + 1}) = {f_new_val:.10e}")
                     print(f"  |εₐ| = {rel_error:.6f}%")
-                    print(f"  Significant figures: {sig_figs}")
+                    print(f"  Significant figures: {self.count_significant_figures(x_new, x_old)}")
                     print()
 
                 # Simple convergence check - stop when error <= epsilon OR max iterations
@@ -203,9 +285,11 @@ class NewtonRaphsonMethod:
 
 
 
-                x_old = x_new
+                x_old, f_val, f_prime_val = x_new, f_new_val, f_prime_new_val
 
-            except Exception as e:
+            # Domain errors from the math-module callables (log/sqrt of a
+            # negative, 1/0, exp overflow) or non-real results
+            except (ZeroDivisionError, OverflowError, ValueError, TypeError) as e:
                 self.error_message = f"Error during iteration {i + 1}: {e}"
                 self.step_strings.append(self.error_message)
                 break
@@ -220,18 +304,14 @@ class NewtonRaphsonMethod:
             )
             self.step_strings.append(self.error_message)
 
+        # Iterate at full precision; round only the reported root
+        if self.root is not None:
+            self.root = self.round_sig(self.root)
+
         self.execution_time = time.time() - start_time
 
         # Calculate significant figures at the END
-        if self.relative_error == 0:
-            final_sig_figs = self.significant_figures  # Use precision when exact solution found
-        elif len(self.iteration_history) >= 2:
-            # Calculate from last two iterations
-            last_x = self.iteration_history[-1]['x_new']
-            prev_x = self.iteration_history[-2]['x_new']
-            final_sig_figs = self.count_significant_figures(last_x, prev_x)
-        else:
-            final_sig_figs = self.significant_figures
+        final_sig_figs = self._final_significant_figures()
 
         # Add final results as a single step
         results = [
@@ -266,19 +346,40 @@ class NewtonRaphsonMethod:
 
         return self.get_results()
 
+    def solve_many(self, initial_guesses):
+        """Run Newton-Raphson from many initial guesses at once.
+
+        Every active guess is advanced with one vectorized f/f' evaluation per
+        iteration. No rounding or step strings are applied. A guess stops at
+        its last valid iterate on a zero or non-finite derivative, or when
+        the next iterate leaves the domain of f. See _numeric.sweep for the
+        returned arrays.
+        """
+        f_fp_vec = _vectorize_equation(self.equation_str)
+
+        def evaluate(x):
+            return [np.broadcast_to(np.asarray(v, dtype=float), x.shape) for v in f_fp_vec(x)]
+
+        starts = np.array(initial_guesses, dtype=float).ravel()
+        with np.errstate(all='ignore'):
+            # f and f' at each current iterate, carried from step to step
+            f_x, fp_x = (v.copy() for v in evaluate(starts))
+
+        def step(idx, x):
+            f_val, f_prime_val = f_x[idx], fp_x[idx]
+            x_new = x - f_val / f_prime_val
+            f_new, f_prime_new = evaluate(x_new)
+            f_x[idx], fp_x[idx] = f_new, f_prime_new
+            # f(x) == 0 is an exact root; a NaN f(x_new) means x_new is
+            # outside the domain of f, so x is kept
+            exact = f_val == 0
+            valid = np.isfinite(f_prime_val) & np.isfinite(x_new) & np.isfinite(f_new)
+            return x_new, valid, exact, None
+
+        return sweep(step, starts, self.max_iterations, self.epsilon)
+
     def get_results(self):
         """Return results as a dictionary."""
-        # Calculate final significant figures for return
-        if self.relative_error == 0:
-            final_sig_figs = self.significant_figures  # Use precision when exact solution found
-        elif len(self.iteration_history) >= 2:
-            # Calculate from last two iterations
-            last_x = self.iteration_history[-1]['x_new']
-            prev_x = self.iteration_history[-2]['x_new']
-            final_sig_figs = self.count_significant_figures(last_x, prev_x)
-        else:
-            final_sig_figs = self.significant_figures
-            
         return {
             'root': self.root,
             'iterations': self.iterations,
@@ -288,7 +389,7 @@ class NewtonRaphsonMethod:
             'error_message': self.error_message,
             'iteration_history': self.iteration_history,
             'step_strings': self.step_strings,
-            'significant_figures': final_sig_figs
+            'significant_figures': self._final_significant_figures()
         }
 
     def print_results(self):
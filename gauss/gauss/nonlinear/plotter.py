@@ -1,62 +1,112 @@
 from io import BytesIO
 import base64
+import functools
+import threading
 import numpy as np
+import sympy as sp
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_agg import FigureCanvasAgg
-import math
+from ._numeric import lambdify_array
 
+# One figure is reused for every plot; matplotlib figures aren't thread-safe,
+# so drawing into it is serialized with _PLOT_LOCK
+_FIG = Figure(figsize=(10, 6), dpi=120)
+FigureCanvasAgg(_FIG)
+_AX = _FIG.subplots()
+_PLOT_LOCK = threading.Lock()
 
-def get_plot_base64(function: str, include_yx_plot: bool = False):
+_X_MIN, _X_MAX = -10, 10
+_Y_LIM = 30
+_COARSE_SAMPLES = 80
+_REFINE_FACTOR = 8
+# A second difference this large leaves the chord about half a pixel off
+# the curve at the plot's scale
+_CURVATURE_TOL = 0.4
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_function(function):
+    """Parse and compile the function for numpy arrays once per string."""
+    expr = sp.sympify(function, locals={"e": sp.E})
+    # Same fallback as the solvers, so anything they solve can be plotted
+    return lambdify_array(sp.Symbol("x"), expr)
+
+
+def _evaluate(user_func, x):
+    with np.errstate(all="ignore"):
+        y = np.asarray(user_func(x), dtype=float)
+    # constant expressions come back as a scalar
+    return np.broadcast_to(y, x.shape)
+
+
+def _sample(user_func):
+    """Sample on a coarse grid, refining intervals where the curve bends.
 
-    safe_env = {
-        "sin": math.sin, "cos": math.cos, "tan": math.tan,
-        "sqrt": math.sqrt, "log": math.log, "exp": math.exp,
-        "pi": math.pi, "e": math.e,
-        "abs": abs, "pow": pow
-    }
+    Intervals next to a large second difference, or where the function
+    switches between finite and non-finite values, are subdivided once.
+    Values are clipped near the visible window first so off-screen growth
+    doesn't attract samples.
+    """
+    x = np.linspace(_X_MIN, _X_MAX, _COARSE_SAMPLES)
+    y = _evaluate(user_func, x)
+
+    with np.errstate(invalid="ignore"):
+        bends = np.abs(np.diff(np.clip(y, -2 * _Y_LIM, 2 * _Y_LIM), 2)) > _CURVATURE_TOL
+    finite = np.isfinite(y)
+    refine = finite[:-1] != finite[1:]
+    refine[:-1] |= bends
+    refine[1:] |= bends
+
+    idx = np.flatnonzero(refine)
+    if idx.size == 0:
+        return x, y
+
+    step = (x[1] - x[0]) / _REFINE_FACTOR
+    x_fine = (x[idx, None] + step * np.arange(1, _REFINE_FACTOR)).ravel()
+    x_all = np.concatenate((x, x_fine))
+    y_all = np.concatenate((y, _evaluate(user_func, x_fine)))
+    order = np.argsort(x_all)
+    return x_all[order], y_all[order]
+
+
+def get_plot_base64(function: str, include_yx_plot: bool = False):
 
-    def user_func(x_val):
-        try:
-            return eval(
-                function,
-                {"__builtins__": None},
-                {**safe_env, "x": x_val},
-            )
-        except:
-            return float("nan")
+    try:
+        x_range, y_range = _sample(_compile_function(function))
+    except Exception:
+        x_range = np.linspace(_X_MIN, _X_MAX, _COARSE_SAMPLES)
+        y_range = np.full_like(x_range, np.nan)
 
-    x_range = np.linspace(-10, 10, 400)
-    y_range = [user_func(x) for x in x_range]
+    with _PLOT_LOCK:
+        ax = _AX
+        ax.clear()
 
-    fig = Figure(figsize=(10, 6), dpi=120)
-    FigureCanvasAgg(fig)
-    ax = fig.subplots()
+        ax.plot(x_range, y_range, label=f"y = {function}", color="blue")
 
-    ax.plot(x_range, y_range, label=f"y = {function}", color="blue")
+        if include_yx_plot:
+            ax.plot(x_range, x_range, label="y = x", color="red", linestyle="--")
 
-    if include_yx_plot:
-        ax.plot(x_range, x_range, label="y = x", color="red", linestyle="--")
+        ax.spines["left"].set_position("center")
+        ax.spines["bottom"].set_position("center")
+        ax.spines["right"].set_color("none")
+        ax.spines["top"].set_color("none")
+        ax.xaxis.set_ticks_position("bottom")
+        ax.yaxis.set_ticks_position("left")
 
-    ax.spines["left"].set_position("center")
-    ax.spines["bottom"].set_position("center")
-    ax.spines["right"].set_color("none")
-    ax.spines["top"].set_color("none")
-    ax.xaxis.set_ticks_position("bottom")
-    ax.yaxis.set_ticks_position("left")
+        ax.set_xticks(np.arange(-10, 11, 1))
+        ax.set_yticks(np.arange(-30, 31, 1))
 
-    ax.set_xticks(np.arange(-10, 11, 1))
-    ax.set_yticks(np.arange(-30, 31, 1))
+        ax.xaxis.set_ticklabels([t if t % 2 == 0 else "" for t in range(-10, 11)])
+        ax.yaxis.set_ticklabels([t if t % 5 == 0 else "" for t in range(-30, 31)])
 
-    ax.xaxis.set_ticklabels([t if t % 2 == 0 else "" for t in range(-10, 11)])
-    ax.yaxis.set_ticklabels([t if t % 5 == 0 else "" for t in range(-30, 31)])
+        ax.grid(True, linestyle="--", alpha=0.3)
+        ax.legend(loc="upper left")
 
-    ax.grid(True, linestyle="--", alpha=0.3)
-    ax.legend(loc="upper left")
+        ax.set_xlim(_X_MIN, _X_MAX)
+        ax.set_ylim(-_Y_LIM, _Y_LIM)
 
-    ax.set_xlim(-10, 10)
-    ax.set_ylim(-30, 30)
+        buf = BytesIO()
+        _FIG.canvas.print_png(buf)
 
-    buf = BytesIO()
-    fig.savefig(buf, format="png", bbox_inches="tight")
     data = base64.b64encode(buf.getvalue()).decode("ascii")
     return f"data:image/png;base64,{data}"
\ No newline at end of file
@@ -1,18 +1,74 @@
 import numpy as np
 import sympy as sy
 from sympy import Symbol
-from decimal import Context, Decimal
+import functools
 import math
+from collections import deque
+from ._numeric import lambdify_array, lambdify_scalar, sweep
+
+
+def _function_key(f):
+    """Cache key for f: the string itself, or str() of a sympy expression/number.
+
+    Equal expressions passed as strings or as sympy objects share one entry.
+    """
+    return f if isinstance(f, str) else str(f)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_function(f):
+    """Parse and compile f once per distinct equation string."""
+    f_expr = sy.sympify(f)
+    if f_expr.is_number:
+        # Constant f: skip code generation
+        value = float(f_expr)
+        return f_expr, lambda x: value
+    # cse=True computes repeated subtrees of f once per call
+    return f_expr, lambdify_scalar(Symbol('x'), f_expr, cse=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _vectorize_function(f):
+    """Compile f for numpy arrays once per distinct equation string."""
+    f_expr, _ = _compile_function(f)
+    return lambdify_array(Symbol('x'), f_expr, cse=True)
+
+
+def _interpolant_slope(xs, fs):
+    """p'(xs[0]) for the Newton polynomial p through the points (xs, fs).
+
+    xs[0] is the newest iterate. Divided differences f[x_0..x_j] are built
+    column by column in place, and p'(x_0) = sum_j f[x_0..x_j] * prod_{i<j, i>0} (x_0 - x_i).
+    """
+    dd = list(fs)
+    slope = 0.0
+    prod = 1.0
+    for j in range(1, len(xs)):
+        for i in range(len(xs) - j):
+            dd[i] = (dd[i + 1] - dd[i]) / (xs[i + j] - xs[i])
+        slope += dd[0] * prod
+        prod *= xs[0] - xs[j]
+    return slope
 
 
 class Secant:
-    def __init__(self, f, x0, x1, tol=0.00001, maxiter=50, precision=5):
-        self.f_expr = sy.sympify(f)
+    def __init__(self, f, x0, x1, tol=0.00001, maxiter=50, precision=5, verbose=True, order=2,
+                 f_tol=None):
+        if not isinstance(order, int) or order < 2:
+            raise ValueError(f"order must be an integer >= 2, got {order!r}")
+        self.f_expr, self._f_num = _compile_function(_function_key(f))
         self.x0 = x0
         self.x1 = x1
         self.tol = tol * 100  # Convert decimal to percentage (0.00001 -> 0.001%)
+        # Optional residual test: |f(x_i)| <= f_tol also stops the iteration
+        # (None disables it, leaving only the relative error test)
+        self.f_tol = f_tol
         self.maxiter = maxiter
         self.precision = precision
+        self.verbose = verbose  # False skips building step_strings
+        # 2 is the classical secant method; k > 2 is Sidi's k-point method,
+        # interpolating the last k iterates (still one f evaluation per step)
+        self.order = order
         self.xsym = Symbol('x')
         self.step_strings = []
         self.iterations = 0
@@ -28,12 +84,8 @@ class Secant:
         # Check for special values
         if np.isnan(x) or np.isinf(x):
             return x
-        try:
-            x_str = str(x)
-            ctx = Context(prec=self.precision)
-            return float(ctx.create_decimal(x_str).normalize())
-        except:
-            return x
+        digits = self.precision - 1 - math.floor(math.log10(abs(x)))
+        return float(round(x, digits))
 
     def relative_error(self, x_new, x_old):
         """Calculate relative error between successive iterations."""
@@ -45,109 +97,198 @@ class Secant:
         """Count correct significant figures."""
         if x_new == 0:
             return 0
-        rel_error_decimal = abs((x_new - x_old) / x_new)
-        if rel_error_decimal == 0:
-            return 15
-        if rel_error_decimal < 1e-10:
-            return 10
-        # Use percentage value in the formula: rel_error_percentage = rel_error_decimal * 100
-        rel_error_percentage = rel_error_decimal * 100
-        n = 2 - math.log10(2 * rel_error_percentage)
-        return max(0, int(n))
+        rel_error_percentage = abs((x_new - x_old) / x_new) * 100
+        return self._sig_figs_from_error(rel_error_percentage)
+
+    @staticmethod
+    def _sig_figs_from_error(rel_error_percentage):
+        """n from |εa| = 0.5 × 10^(2-n) %, clamped to 0..15.
+
+        The 1e-300 keeps log10 finite for a zero error, which then clamps to 15.
+        """
+        return min(15, max(0, int(2 - math.log10(2 * rel_error_percentage + 1e-300))))
+
+    def _final_significant_figures(self, re):
+        """Significant figures of the answer from the last relative error (%)."""
+        if re == 0:
+            return self.precision  # Use precision when exact solution found
+        return self._sig_figs_from_error(re)
 
     def solve(self):
         """Solve using Secant method and return the root."""
         x0 = self.round_sig(self.x0)
         x1 = self.round_sig(self.x1)
+        # Iterate at full precision; round only what is displayed
+        r = self.round_sig
+        verbose = self.verbose
+        sidi = self.order > 2
+
+        if verbose:
+            if sidi:
+                self.step_strings.append(
+                    f"Sidi {self.order}-point Method Formula: x_{{i+1}} = x_i - f(x_i) / p'(x_i), "
+                    f"p interpolating f at the last {self.order} iterates\n"
+                )
+            else:
+                self.step_strings.append(
+                    "Secant Method Formula: x_{i+1} = x_i - f(x_i) * (x_i - x_{i-1}) / (f(x_i) - f(x_{i-1}))\n"
+                )
 
-        self.step_strings.append(
-            "Secant Method Formula: x_{i+1} = x_i - f(x_i) * (x_i - x_{i-1}) / (f(x_i) - f(x_{i-1}))\n"
-        )
+        # f(x_{i-1}) is carried over from the previous iteration's f(x_i),
+        # so each iteration evaluates f only once
+        f0 = float(self._f_num(x0))
+        if sidi:
+            # Newest iterate first; the oldest drops off beyond `order` points
+            xs = deque([x0], maxlen=self.order)
+            fs = deque([f0], maxlen=self.order)
 
         for i in range(self.maxiter):
-            # Evaluate function at current points
-            f0 = self.round_sig(float(self.f_expr.subs(self.xsym, x0)))
-            f1 = self.round_sig(float(self.f_expr.subs(self.xsym, x1)))
+            f1 = float(self._f_num(x1))
 
-            # Check for division by zero
-            if f1 == f0:
-                self.step_strings.append(
-                    f"\nIteration {i}: Method failed - f(x_i) = f(x_{{i-1}}) = {f1}"
-                )
-                self.step_strings.append("Cannot continue: denominator is zero")
-                return None
+            if sidi:
+                xs.appendleft(x1)
+                fs.appendleft(f1)
+                try:
+                    slope = _interpolant_slope(xs, fs)
+                except ZeroDivisionError:
+                    slope = 0.0  # a repeated iterate leaves p undefined
+                if slope == 0:
+                    if verbose:
+                        self.step_strings.append(
+                            f"\nIteration {i}: Method failed - p'(x_i) = 0 at x_i = {r(x1)}"
+                        )
+                        self.step_strings.append("Cannot continue: denominator is zero")
+                    return None
+
+                x_new = x1 - f1 / slope
+            else:
+                # Check for division by zero
+                if f1 == f0:
+                    if verbose:
+                        self.step_strings.append(
+                            f"\nIteration {i}: Method failed - f(x_i) = f(x_{{i-1}}) = {r(f1)}"
+                        )
+                        self.step_strings.append("Cannot continue: denominator is zero")
+                    return None
 
-            # Calculate next approximation
-            x_new = x1 - f1 * (x1 - x0) / (f1 - f0)
-            x_new = self.round_sig(x_new)
+                # Calculate next approximation
+                x_new = x1 - f1 * (x1 - x0) / (f1 - f0)
 
             # Calculate relative error
             re = self.relative_error(x_new, x1)
 
             # Store iteration details
-            step = (
-                f"\nIteration {i}:\n"
-                f"  x_{{i-1}} = {x0}\n"
-                f"  x_i = {x1}\n"
-                f"  f(x_{{i-1}}) = {f0}\n"
-                f"  f(x_i) = {f1}\n"
-                f"  x_{{i+1}} = {x1} - {f1} * ({x1} - {x0}) / ({f1} - {f0})\n"
-                f"  x_{{i+1}} = {x_new}\n"
-                f"  Relative Error = |{x_new} - {x1}| / |{x_new}| = {re}%"
-            )
-            self.step_strings.append(step)
+            if verbose and sidi:
+                self.step_strings.append(
+                    f"\nIteration {i}:\n"
+                    f"  x_i = {r(x1)}\n"
+                    f"  f(x_i) = {r(f1)}\n"
+                    f"  p'(x_i) = {r(slope)} (through {len(xs)} points)\n"
+                    f"  x_{{i+1}} = {r(x1)} - {r(f1)} / {r(slope)}\n"
+                    f"  x_{{i+1}} = {r(x_new)}\n"
+                    f"  Relative Error = |{r(x_new)} - {r(x1)}| / |{r(x_new)}| = {re}%"
+                )
+            elif verbose:
+                step = (
+                    f"\nIteration {i}:\n"
+                    f"  x_{{i-1}} = {r(x0)}\n"
+                    f"  x_i = {r(x1)}\n"
+                    f"  f(x_{{i-1}}) = {r(f0)}\n"
+                    f"  f(x_i) = {r(f1)}\n"
+                    f"  x_{{i+1}} = {r(x1)} - {r(f1)} * ({r(x1)} - {r(x0)}) / ({r(f1)} - {r(f0)})\n"
+                    f"  x_{{i+1}} = {r(x_new)}\n"
+                    f"  Relative Error = |{r(x_new)} - {r(x1)}| / |{r(x_new)}| = {re}%"
+                )
+                self.step_strings.append(step)
 
             self.iterations = i + 1
             self.approximateError = re
 
+            # Residual test: f(x_i) is already within f_tol of zero, so
+            # x_{i+1} is accepted without evaluating f there
+            residual_ok = self.f_tol is not None and abs(f1) <= self.f_tol
+
             # Simple convergence check - stop when error <= tolerance OR max iterations
-            if re <= self.tol:
-                self.step_strings.append(
-                    f"\n✓ Convergence achieved!\n"
-                    f"Root found: x = {x_new}\n"
-                    f"Iterations: {self.iterations}\n"
-                    f"Final relative error: {re}%"
-                )
-                self.root = x_new
+            if re <= self.tol or residual_ok:
+                if verbose:
+                    self.step_strings.append(
+                        "\n✓ Convergence achieved!\n"
+                        + (f"|f(x_i)| = {abs(r(f1))} <= {self.f_tol}\n" if re > self.tol else "")
+                        + f"Root found: x = {r(x_new)}\n"
+                        f"Iterations: {self.iterations}\n"
+                        f"Final relative error: {re}%"
+                    )
+                self.root = r(x_new)
                 self.converged = True
                 
                 # Calculate significant figures at the END
-                if re == 0:
-                    self.significant_figures = self.precision  # Use precision when exact solution found
-                else:
-                    # Use the actual relative error percentage that was calculated
-                    if re < 1e-10:
-                        self.significant_figures = 10
-                    else:
-                        n = 2 - math.log10(2 * re)  # re is already in percentage
-                        self.significant_figures = max(0, int(n))
+                self.significant_figures = self._final_significant_figures(re)
                 
-                return x_new
+                return self.root
 
             # Update for next iteration
-            x0 = x1
+            x0, f0 = x1, f1
             x1 = x_new
 
         # Max iterations reached without convergence
-        self.step_strings.append(
-            f"\n✗ Maximum iterations ({self.maxiter}) reached without convergence.\n"
-            f"Last approximation: x = {x1}\n"
-            f"Final relative error: {re}%"
-        )
-        self.root = x1
+        if verbose:
+            self.step_strings.append(
+                f"\n✗ Maximum iterations ({self.maxiter}) reached without convergence.\n"
+                f"Last approximation: x = {r(x1)}\n"
+                f"Final relative error: {re}%"
+            )
+        self.root = r(x1)
         
         # Calculate significant figures at the END
-        if re == 0:
-            self.significant_figures = self.precision  # Use precision when exact solution found
-        else:
-            # Use the actual relative error percentage that was calculated
-            if re < 1e-10:
-                self.significant_figures = 10
-            else:
-                n = 2 - math.log10(2 * re)  # re is already in percentage
-                self.significant_figures = max(0, int(n))
+        self.significant_figures = self._final_significant_figures(re)
         
-        return x1
+        return self.root
+
+    @classmethod
+    def solve_batch(cls, f, x0, x1, tol=0.00001, maxiter=50, precision=5, f_tol=None):
+        """Run the secant method from many (x0, x1) starting pairs at once.
+
+        Every active pair is advanced with one vectorized f evaluation per
+        iteration, and stops on the same relative error and f_tol tests as
+        solve(). No step strings are built; roots are rounded to
+        `precision` significant figures at the end. See _numeric.sweep for
+        the returned arrays.
+        """
+        f_vec = _vectorize_function(_function_key(f))
+
+        def evaluate(x):
+            return np.broadcast_to(np.asarray(f_vec(x), dtype=float), x.shape)
+
+        x0, x1 = (a.copy() for a in np.broadcast_arrays(np.array(x0, dtype=float).ravel(),
+                                                         np.array(x1, dtype=float).ravel()))
+        with np.errstate(all='ignore'):
+            # f(x_{i-1}) and f(x_i) of each pair, carried from step to step
+            f0 = evaluate(x0).copy()
+            f1 = evaluate(x1).copy()
+
+        def step(idx, xb):
+            xa, fa, fb = x0[idx], f0[idx], f1[idx]
+            denom = fb - fa
+            x_new = xb - fb * (xb - xa) / denom
+            f_new = evaluate(x_new)
+            x0[idx], f0[idx] = xb, fb
+            f1[idx] = f_new
+            # f(x_i) == f(x_{i-1}), a non-finite step or an x_new outside the
+            # domain of f stops that pair at x_i
+            valid = (denom != 0) & np.isfinite(x_new) & np.isfinite(f_new)
+            settled = np.abs(fb) <= f_tol if f_tol is not None else None
+            return x_new, valid, None, settled
+
+        # tol is converted to a percentage, as in __init__
+        result = sweep(step, x1, maxiter, tol * 100)
+
+        # Round to significant figures; zero/non-finite roots are left as-is
+        roots = result['roots']
+        with np.errstate(all='ignore'):
+            scale = 10.0 ** (precision - 1 - np.floor(np.log10(np.abs(roots))))
+        ok = np.isfinite(scale) & np.isfinite(roots)
+        roots[ok] = np.round(roots[ok] * scale[ok]) / scale[ok]
+        return result
 
     def get_answer(self):
         """Return step strings for backward compatibility."""
@@ -1,4 +1,4 @@
-import copy
+import numpy as np
 
 
 class SolutionType:
@@ -6,47 +6,64 @@ class SolutionType:
     INFINITE = 2
     UNIQUE = 3
 
-    def __init__(self, augmented_matrix, tol=1e-10):
-        self.A = [row[:-1] for row in augmented_matrix]  # coefficient part
-        self.b = [row[-1] for row in augmented_matrix]  # right-hand side
+    def __init__(self, augmented_matrix, tol=1e-10, dtype=np.float64):
+        augmented = np.array(augmented_matrix, dtype=np.float64)
+        self.A = augmented[:, :-1]  # coefficient part (view)
+        self.b = augmented[:, -1]  # right-hand side (view)
         self.n = len(augmented_matrix)
-        self.M = [row[:] for row in augmented_matrix]  # working copy
+        self.dtype = np.dtype(dtype)
+        self.M = augmented.astype(self.dtype)  # working copy; elimination mutates it
         self.tol = tol
 
+        # A reduced-precision working matrix gets a tolerance scaled to its
+        # round-off; results too close to singular are re-checked in float64
+        self._work_tol = tol
+        if self.dtype != np.float64 and augmented.size:
+            self._work_tol = max(tol, self.n * np.finfo(self.dtype).eps * np.abs(augmented).max())
+
     def _swap_rows(self, i, j):
         if i != j:
-            self.M[i], self.M[j] = self.M[j], self.M[i]
-
-    def _find_pivot(self, col, start_row):
-        best_idx = None
-        best_val = 0
-        for i in range(start_row, self.n):
-            val = abs(self.M[i][col])
-            if val > self.tol and (best_idx is None or val > best_val):
-                best_val = val
-                best_idx = i
-        return best_idx
+            self.M[[i, j]] = self.M[[j, i]]
+
+    def _find_pivot(self, col, start_row, tol):
+        if start_row >= self.n:
+            return None
+        column = np.abs(self.M[start_row:, col])
+        idx = int(np.argmax(column))
+        return start_row + idx if column[idx] > tol else None
 
     def gaussian_elimination(self):
+        result, min_pivot = self._eliminate(self._work_tol)
+        if self.M.dtype != np.float64 and not (
+                result == self.UNIQUE and min_pivot > 100 * self._work_tol):
+            # Near-singular in reduced precision: redo the elimination in float64
+            self.M = np.column_stack((self.A, self.b))
+            result, _ = self._eliminate(self.tol)
+        return result
+
+    def _eliminate(self, tol):
+        """Reduce self.M in place; returns (classification, smallest pivot)."""
         row = 0  # current row
         pivot_cols = set()
+        min_pivot = np.inf
 
         for col in range(self.n):
             # Step 1: Find pivot
-            pivot_row = self._find_pivot(col, row)
+            pivot_row = self._find_pivot(col, row, tol)
             if pivot_row is None:
                 continue
 
             # Step 2: Swap to bring pivot to position
             self._swap_rows(row, pivot_row)
+            min_pivot = min(min_pivot, abs(self.M[row, col]))
 
-            # Step 3: Eliminate below
-            for i in range(row + 1, self.n):
-                if abs(self.M[i][col]) < self.tol:
-                    continue
-                factor = self.M[i][col] / self.M[row][col]
-                for j in range(col, self.n + 1):
-                    self.M[i][j] -= factor * self.M[row][j]
+            # Step 3: Eliminate below with one rank-1 update; rows whose entry
+            # is already below tol get a zero factor and are left untouched
+            below = self.M[row + 1:, col]
+            mask = np.abs(below) >= tol
+            if mask.any():
+                factors = np.where(mask, below / self.M[row, col], 0.0)
+                self.M[row + 1:, col:] -= np.outer(factors, self.M[row, col:])
 
             pivot_cols.add(col)
             row += 1
@@ -57,14 +74,32 @@ class SolutionType:
 
         # Now analyze the reduced form
         # Check rows from rank onward (should be all zeros in coefficients)
-        for i in range(rank, self.n):
-            # If coefficient row is zero but RHS is not → inconsistent
-            if abs(self.M[i][self.n]) > self.tol:
-                return self.INCONSISTENT
+        # If coefficient row is zero but RHS is not → inconsistent
+        if np.any(np.abs(self.M[rank:, self.n]) > tol):
+            return self.INCONSISTENT, min_pivot
 
         # If rank < n → free variables → infinite solutions
         if rank < self.n:
-            return self.INFINITE
+            return self.INFINITE, min_pivot
 
         # Otherwise: full rank square system and consistent → unique
+        return self.UNIQUE, min_pivot
+
+    def classify_fast(self):
+        # Rouché–Capelli via SVD ranks of A and [A | b]; same result codes as
+        # gaussian_elimination without the Python-level elimination
+        if self.dtype != np.float64:
+            # Clearly nonsingular square A means a unique solution; anything
+            # closer to singular is decided in float64 below
+            s = np.linalg.svd(self.A.astype(self.dtype), compute_uv=False)
+            if s.size and s.min() > 100 * self._work_tol:
+                return self.UNIQUE
+
+        r_a = np.linalg.matrix_rank(self.A, tol=self.tol)
+        r_aug = np.linalg.matrix_rank(np.column_stack((self.A, self.b)), tol=self.tol)
+
+        if r_a < r_aug:
+            return self.INCONSISTENT
+        if r_a < self.n:
+            return self.INFINITE
         return self.UNIQUE
\ No newline at end of file